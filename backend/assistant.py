@@ -1,8 +1,14 @@
+import re
 from filter_extraction import extract_filters
-from walmart_search import search_walmart_products
+from walmart_search import (
+    search_walmart_products_parallel,
+    merge_product_results,
+    build_search_queries,
+)
 from chat_memory import ChatMemory
 from reply_generator import generate_reply
-from recommender import recommend_best_product
+from recommender import recommend_best_product, rerank_products
+from product_enrichment import enrich_products, prefetch_details
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi import Request
@@ -99,6 +105,7 @@ Try things like:
         if best:
             memory.last_selected = best
             memory.last_products = [best]
+            enrich_products([best])
             response_text = generate_reply(message, [best], "refine",
                                            intent=memory.intent, tone=memory.tone)
             products = [best]
@@ -152,7 +159,7 @@ Try things like:
         if not category:
             return format_response("⚠️ I need a category first. Try saying what you're shopping for.", [], session_id)
 
-        products = search_walmart_products(category, filters, max_results=10)
+        products = search_products(memory, category, filters, max_results=10)
         if not products:
             return format_response("😕 I couldn’t find anything better. Maybe tweak the filters?", [], session_id)
 
@@ -176,7 +183,7 @@ Try things like:
         if not category:
             return format_response("⚠️ Please mention what you're looking for.", [], session_id)
 
-        products = search_walmart_products(category, filters, max_results=10)
+        products = search_products(memory, category, filters, max_results=10)
         if not products:
             return format_response("😕 I couldn’t find matching products. Try adjusting your request.", [], session_id)
 
@@ -187,11 +194,10 @@ Try things like:
         if len(refs) < 2:
             return format_response("⚠️ Please name two products you'd like to compare.", [], session_id)
 
-        ref1 = memory.resolve_product_reference(refs[0])
-        ref2 = memory.resolve_product_reference(refs[1])
+        resolved = resolve_compare_products(memory, refs[:2])
 
-        if ref1 and ref2:
-            products = [ref1, ref2]
+        if all(resolved):
+            products = enrich_products(resolved)
         else:
             return format_response("⚠️ Couldn’t find one or both items to compare.", [], session_id)
 
@@ -206,6 +212,71 @@ Try things like:
 
     return format_response(response_text, products[:3], session_id)
 
+def search_products(memory, category, filters, max_results=10):
+    """Search the category, fanning out one search per brand when several are requested"""
+    queries = build_search_queries(category, filters)
+    result_lists = search_walmart_products_parallel(queries, filters, max_results=max_results)
+    if len(result_lists) == 1:
+        return result_lists[0]
+
+    merged = merge_product_results(result_lists)
+    return rerank_products(memory, merged)[:max_results]
+
+# Words that refer to a product by position or pronoun rather than by name
+REFERENCE_WORDS = {
+    "this", "that", "these", "those", "it", "the", "a", "an", "one", "ones",
+    "previous", "last", "first", "second", "third", "other", "another",
+    "cheaper", "cheapest", "better", "best", "pricier", "expensive", "top", "item", "product",
+}
+
+def product_name_tokens(ref):
+    """Name tokens of a compare reference; empty if it's just a pronoun or ordinal"""
+    tokens = re.findall(r"[a-z0-9]+", ref.lower())
+    return {t for t in tokens if t not in REFERENCE_WORDS}
+
+def matches_reference(product, tokens):
+    """True if the product title contains every name token of the reference"""
+    title = (product.get("title") or "").lower()
+    title_tokens = set(re.findall(r"[a-z0-9]+", title))
+    compact_title = re.sub(r"[^a-z0-9]", "", title)
+    for token in tokens:
+        if token in title_tokens:
+            continue
+        # Model numbers may be hyphenated or spaced in the title ("G-502", "G 502")
+        if any(c.isdigit() for c in token) and token in compact_title:
+            continue
+        return False
+    return True
+
+def resolve_compare_products(memory, refs):
+    """Resolve compare references, searching in parallel for named products not already in memory"""
+    resolved = [memory.resolve_product_reference(ref) for ref in refs]
+    # Details for products already in memory are fetched while the others are searched
+    prefetch_details([p for p in resolved if p])
+    missing = [
+        ref for ref, product in zip(refs, resolved)
+        if product is None and ref and product_name_tokens(ref)
+    ]
+    if not missing:
+        return resolved
+
+    # Named products are looked up in the session's category but without its price filters
+    category = memory.get_category()
+    queries = [
+        f"{ref} {category}" if category and category not in ref.lower() else ref
+        for ref in missing
+    ]
+    result_lists = search_walmart_products_parallel(queries, {}, max_results=5)
+
+    found = {}
+    for ref, results in zip(missing, result_lists):
+        tokens = product_name_tokens(ref)
+        found[ref] = next((p for p in results if matches_reference(p, tokens)), None)
+
+    prefetch_details([p for p in found.values() if p])
+    memory.add_products([p for p in found.values() if p])
+    return [product or found.get(ref) for ref, product in zip(refs, resolved)]
+
 def format_response(response_text: str, products: list, session_id: str) -> dict:
     """Format final response structure"""
     return {
@@ -0,0 +1,99 @@
+import time
+import threading
+from config import (
+    WARM_TOP_N,
+    WARM_MAX_CALLS,
+    WARM_WINDOW_DAYS,
+    WARM_INTERVAL,
+    WARM_MIN_DELAY,
+    WARM_LOCK_PATH,
+)
+from query_log import top_queries
+from walmart_search import (
+    search_walmart_products,
+    search_cache,
+    search_cache_key,
+    load_search_cache,
+    save_search_cache,
+)
+
+_lock_file = None  # held open for the life of the process that owns the warmer
+
+
+def warm_search_cache(top_n=WARM_TOP_N, max_calls=WARM_MAX_CALLS, min_delay=WARM_MIN_DELAY,
+                      window_days=WARM_WINDOW_DAYS):
+    """
+    Pre-fetch results for the most popular recent searches that aren't cached yet.
+    At most `max_calls` SerpAPI calls are made per run, spaced at least
+    `min_delay` seconds apart, to stay within quota.
+    Returns the number of searches fetched.
+    """
+    fetched = 0
+    calls = 0
+    last_call = 0.0
+    since = time.time() - window_days * 24 * 60 * 60
+    for query, filters in top_queries(top_n, since=since):
+        if search_cache_key(query, filters) in search_cache:
+            continue
+        if calls >= max_calls:
+            break
+
+        wait = min_delay - (time.time() - last_call)
+        if wait > 0:
+            time.sleep(wait)
+        last_call = time.time()
+        calls += 1
+
+        if search_walmart_products(query, filters, max_results=10):
+            fetched += 1
+            # Save as we go so other workers pick up head queries before the run ends
+            save_search_cache()
+
+    return fetched
+
+
+def _acquire_warmer_lock(path=WARM_LOCK_PATH):
+    """Take a non-blocking file lock so only one worker process runs the warmer."""
+    try:
+        import fcntl
+    except ImportError:
+        return True  # No flock (e.g. Windows); assume a single process
+
+    global _lock_file
+    _lock_file = open(path, "w")
+    try:
+        fcntl.flock(_lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except OSError:
+        _lock_file.close()
+        _lock_file = None
+        return False
+
+
+def _run_forever(interval):
+    while True:
+        try:
+            fetched = warm_search_cache()
+            print(f"🔥 Cache warmer fetched {fetched} searches")
+        except Exception as e:
+            print(f"🔴 Cache warm failed: {e}")
+        time.sleep(interval)
+
+
+def start_cache_warmer(interval=WARM_INTERVAL):
+    """
+    Load the persisted cache, then, if no other process is already warming,
+    warm it now and every `interval` seconds in the background.
+    """
+    load_search_cache()
+    if not _acquire_warmer_lock():
+        return None
+    thread = threading.Thread(target=_run_forever, args=(interval,), daemon=True)
+    thread.start()
+    return thread
+
+
+# Direct run: one warm pass
+if __name__ == "__main__":
+    load_search_cache()
+    print("Fetched:", warm_search_cache())
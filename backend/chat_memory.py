@@ -1,4 +1,5 @@
 import re
+from query_log import log_query
 
 class ChatMemory:
     def __init__(self):
@@ -52,6 +53,10 @@ class ChatMemory:
 
         self.last_action = extraction_result.get("action", "search")
 
+        # Feed the cache warmer's popularity stats
+        if self.last_action in ["search", "refine", "sort"] and self.category:
+            log_query(self.category, self.filters)
+
     def save_products(self, products):
         self.last_products = products
         self.product_lookup = {p["title"].lower(): p for p in products}
@@ -59,6 +64,13 @@ class ChatMemory:
         if products:
             self.last_selected = products[0]
 
+    def add_products(self, products):
+        # Grow the lookups without replacing the current result list
+        for p in products:
+            if p.get("title"):
+                self.product_lookup[p["title"].lower()] = p
+                self.full_product_lookup[p["title"].lower()] = p
+
     def resolve_product_reference(self, name_or_ref):
         if not name_or_ref:
             return None
@@ -5,3 +5,22 @@ load_dotenv()
 MISTRAL_API_KEY = os.getenv("MISTRAL_API_KEY")
 MISTRAL_MODEL = "mistral-small"  # or "mistral-medium" if needed
 SERPAPI_KEY = os.getenv("SERPAPI_KEY")
+
+# Search result cache and cache warmer (relative paths are resolved against backend/)
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+SEARCH_CACHE_PATH = os.path.join(BACKEND_DIR, os.getenv("SEARCH_CACHE_PATH", "search_cache.json"))
+SEARCH_CACHE_TTL = int(os.getenv("SEARCH_CACHE_TTL", 6 * 60 * 60))  # seconds
+QUERY_LOG_PATH = os.path.join(BACKEND_DIR, os.getenv("QUERY_LOG_PATH", "query_log.jsonl"))
+QUERY_LOG_MAX_BYTES = int(os.getenv("QUERY_LOG_MAX_BYTES", 5 * 1024 * 1024))  # rotate the log past this size
+WARM_LOCK_PATH = os.path.join(BACKEND_DIR, os.getenv("WARM_LOCK_PATH", "cache_warmer.lock"))
+WARM_TOP_N = int(os.getenv("WARM_TOP_N", 20))
+WARM_MAX_CALLS = int(os.getenv("WARM_MAX_CALLS", 30))  # SerpAPI calls allowed per warm run
+WARM_WINDOW_DAYS = float(os.getenv("WARM_WINDOW_DAYS", 7))  # only count queries from the last N days
+WARM_INTERVAL = int(os.getenv("WARM_INTERVAL", 60 * 60))  # seconds between warm runs
+WARM_MIN_DELAY = float(os.getenv("WARM_MIN_DELAY", 2.0))  # seconds between SerpAPI calls while warming
+
+# Search fan-out and product detail enrichment
+MAX_PARALLEL_SEARCHES = int(os.getenv("MAX_PARALLEL_SEARCHES", 4))  # SerpAPI calls in flight per fan-out search
+DETAILS_TTL = int(os.getenv("DETAILS_TTL", 6 * 60 * 60))  # seconds a fetched product detail stays fresh
+ENRICH_DEADLINE = float(os.getenv("ENRICH_DEADLINE", 0.3))  # seconds the reply will wait for detail fetches
+MAX_ENRICHED = int(os.getenv("MAX_ENRICHED", 3))
@@ -0,0 +1,20 @@
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # No flock (e.g. Windows); callers fall back to their thread locks
+
+
+@contextmanager
+def file_lock(path):
+    """Hold an exclusive flock on `path` (a sidecar lock file) for the duration of the block."""
+    if fcntl is None:
+        yield
+        return
+    with open(path, "a") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
@@ -1,11 +1,21 @@
 # backend/main.py
 import uuid
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from assistant import get_response  # function defined in assistant.py
+from cache_warmer import start_cache_warmer
+from walmart_search import save_search_cache
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Pre-fetch popular searches so the first users after a deploy hit a warm cache
+    start_cache_warmer()
+    yield
+    save_search_cache()
+
+app = FastAPI(lifespan=lifespan)
 
 # Allow requests from React dev server
 app.add_middleware(
@@ -0,0 +1,75 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from config import DETAILS_TTL, ENRICH_DEADLINE, MAX_ENRICHED
+from walmart_search import fetch_walmart_product_details
+from ttl_cache import TTLCache
+
+details_cache = TTLCache(ttl=DETAILS_TTL)
+
+# Shared pool so fetches that miss the deadline keep running and fill the cache
+_executor = ThreadPoolExecutor(max_workers=MAX_ENRICHED * 2)
+_in_flight = {}
+_in_flight_lock = threading.Lock()
+
+
+def _fetch_and_cache(url, product_id):
+    details = fetch_walmart_product_details(product_id)
+    if details:
+        details_cache.set(url, details)
+    return details
+
+
+def _forget(url, future):
+    # Only drop the entry if a newer fetch hasn't replaced it
+    with _in_flight_lock:
+        if _in_flight.get(url) is future:
+            del _in_flight[url]
+
+
+def _start_fetches(products):
+    """Apply cached details and submit fetches for the rest. Returns {future: product}."""
+    pending = {}
+    for p in products[:MAX_ENRICHED]:
+        url = p.get("url")
+        if not url or not p.get("product_id") or p.get("details"):
+            continue
+
+        cached = details_cache.get(url)
+        if cached:
+            p["details"] = cached
+            continue
+
+        with _in_flight_lock:
+            future = _in_flight.get(url)
+            submitted = future is None or future.done()
+            if submitted:
+                future = _executor.submit(_fetch_and_cache, url, p["product_id"])
+                _in_flight[url] = future
+        if submitted:
+            # Registered outside the lock: it runs inline if the fetch already finished
+            future.add_done_callback(lambda f, url=url: _forget(url, f))
+        pending[future] = p
+    return pending
+
+
+def prefetch_details(products):
+    """Start detail fetches without waiting, so they overlap other work before enrich_products."""
+    _start_fetches(products)
+
+
+def enrich_products(products, deadline=ENRICH_DEADLINE):
+    """
+    Attach a "details" dict (specs, seller, availability) to up to MAX_ENRICHED products.
+    Cached details are used directly; the rest are fetched in parallel (or joined if
+    already started by prefetch_details) and anything not back within `deadline`
+    seconds is left unenriched.
+    """
+    pending = _start_fetches(products)
+    if pending:
+        done, _ = wait(pending, timeout=deadline)
+        for future in done:
+            details = future.result()
+            if details:
+                pending[future]["details"] = details
+
+    return products
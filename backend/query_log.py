@@ -0,0 +1,59 @@
+import os
+import json
+import time
+import threading
+from collections import Counter
+from config import QUERY_LOG_PATH, QUERY_LOG_MAX_BYTES
+from file_lock import file_lock
+from walmart_search import build_search_queries, CACHE_FILTER_KEYS
+
+_lock = threading.Lock()
+
+
+def log_query(category, filters, path=QUERY_LOG_PATH):
+    """Append the searches one (category, filters) turn runs to the query log."""
+    if not category:
+        return
+    entry = {
+        "ts": time.time(),
+        "queries": build_search_queries(category, filters),
+        "filters": {k: filters.get(k) for k in CACHE_FILTER_KEYS if filters.get(k) is not None},
+    }
+    try:
+        # The file lock also covers other worker processes rotating the same log
+        with _lock, file_lock(f"{path}.lock"):
+            # Keep one rotated file so the log never grows past ~2x the cap
+            if os.path.exists(path) and os.path.getsize(path) > QUERY_LOG_MAX_BYTES:
+                os.replace(path, f"{path}.1")
+            with open(path, "a") as f:
+                f.write(json.dumps(entry) + "\n")
+    except Exception as e:
+        print(f"❌ Query log write failed: {e}")
+
+
+def top_queries(n, path=QUERY_LOG_PATH, since=None):
+    """Return the n most frequent (query, filters) searches logged since `since`, most popular first."""
+    counts = Counter()
+    for log_path in [f"{path}.1", path]:
+        try:
+            with open(log_path) as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    if since and entry.get("ts", 0) < since:
+                        continue
+                    for query in entry.get("queries", []):
+                        key = json.dumps([query.lower(), entry.get("filters", {})], sort_keys=True)
+                        counts[key] += 1
+        except FileNotFoundError:
+            continue
+
+    return [tuple(json.loads(key)) for key, _ in counts.most_common(n)]
+
+
+# Offline popularity report
+if __name__ == "__main__":
+    for query, filters in top_queries(20):
+        print(query, filters)
@@ -11,7 +11,7 @@ You will receive:
 - The user query
 - The detected shopping intent (e.g., gaming, gifting, personal use)
 - The tone of the user (e.g., professional, casual, enthusiastic)
-- A list of top 1–3 matching products (with title, price, rating)
+- A list of top 1–3 matching products (with title, price, rating, and sometimes details like specs, seller, availability)
 - The user action (search | compare | refine | sort)
 
 Your job is to generate a short, helpful natural-language response that:
@@ -20,6 +20,7 @@ Your job is to generate a short, helpful natural-language response that:
 - Clearly explains what you found or compared
 - Highlights useful details like brand, rating, or value
 - NEVER lists exact product specs — those will be printed separately
+- When details are given, use them to explain trade-offs in plain words (e.g. "lighter", "sold by Walmart", "out of stock") without quoting spec values
 - NEVER make up or hallucinate products
 
 Be friendly but brief. Encourage refinement or comparison.
@@ -28,13 +29,16 @@ Be friendly but brief. Encourage refinement or comparison.
 def generate_reply(user_query, products, action, intent=None, tone=None):
     try:
         # Format top 1–3 products into structured summaries
-        examples = [
-            {
+        examples = []
+        for p in products[:3]:
+            example = {
                 "title": p.get("title"),
                 "price": p.get("price"),
                 "rating": p.get("rating"),
-            } for p in products[:3]
-        ]
+            }
+            if p.get("details"):
+                example["details"] = p["details"]
+            examples.append(example)
 
         # Assemble prompt dictionary
         prompt = {
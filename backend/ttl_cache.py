@@ -0,0 +1,72 @@
+import os
+import json
+import time
+import threading
+from file_lock import file_lock
+
+class TTLCache:
+    """Small thread-safe dict whose entries expire after `ttl` seconds."""
+
+    def __init__(self, ttl, max_size=1000):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if time.time() - stored_at > self.ttl:
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            if key not in self._data and len(self._data) >= self.max_size:
+                # Evict the oldest entry
+                oldest = min(self._data, key=lambda k: self._data[k][0])
+                del self._data[oldest]
+            self._data[key] = (time.time(), value)
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def save(self, path):
+        """
+        Merge unexpired entries into a JSON file, keeping the newest copy of each key,
+        so several processes saving the same file don't drop each other's entries.
+        Keys must be strings.
+        """
+        now = time.time()
+        with self._lock:
+            data = {k: [t, v] for k, (t, v) in self._data.items() if now - t <= self.ttl}
+
+        with file_lock(f"{path}.lock"):
+            for k, (t, v) in self._read(path).items():
+                if now - t <= self.ttl and (k not in data or t > data[k][0]):
+                    data[k] = [t, v]
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp, path)
+
+    def load(self, path):
+        """Merge entries from a file written by save(), keeping the newest copy of each key."""
+        data = self._read(path)
+        now = time.time()
+        with self._lock:
+            for k, (t, v) in data.items():
+                if now - t > self.ttl:
+                    continue
+                if k not in self._data or t > self._data[k][0]:
+                    self._data[k] = (t, v)
+
+    def _read(self, path):
+        if not os.path.exists(path):
+            return {}
+        with open(path) as f:
+            return json.load(f)
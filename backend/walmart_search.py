@@ -1,11 +1,56 @@
 import os
+import json
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 from serpapi import GoogleSearch
+from config import SEARCH_CACHE_PATH, SEARCH_CACHE_TTL, MAX_PARALLEL_SEARCHES
+from ttl_cache import TTLCache
 
 load_dotenv()
 SERPAPI_KEY = os.getenv("SERPAPI_KEY")
 
+search_cache = TTLCache(ttl=SEARCH_CACHE_TTL)
+_search_cache_mtime = 0.0  # mtime of the cache file when this process last read it
+
+# Filters that change what search_walmart_products returns
+CACHE_FILTER_KEYS = ["sort_by", "price_min", "price_max"]
+
+def search_cache_key(query, filters, max_results=10):
+    return json.dumps([query.lower()] + [filters.get(k) for k in CACHE_FILTER_KEYS] + [max_results])
+
+def load_search_cache(path=SEARCH_CACHE_PATH):
+    global _search_cache_mtime
+    try:
+        mtime = os.path.getmtime(path) if os.path.exists(path) else 0.0
+        search_cache.load(path)
+        _search_cache_mtime = mtime
+    except Exception as e:
+        print(f"🔴 Search cache load failed: {e}")
+
+def reload_search_cache_if_changed(path=SEARCH_CACHE_PATH):
+    """Pick up entries another process (e.g. the cache warmer) saved since our last read."""
+    try:
+        changed = os.path.getmtime(path) > _search_cache_mtime
+    except OSError:
+        return False
+    if changed:
+        load_search_cache(path)
+    return changed
+
+def save_search_cache(path=SEARCH_CACHE_PATH):
+    try:
+        search_cache.save(path)
+    except Exception as e:
+        print(f"🔴 Search cache save failed: {e}")
+
 def search_walmart_products(query, filters, max_results=10):
+    key = search_cache_key(query, filters, max_results)
+    cached = search_cache.get(key)
+    if cached is None and reload_search_cache_if_changed():
+        cached = search_cache.get(key)
+    if cached is not None:
+        return [dict(p) for p in cached]
+
     try:
         params = {
             "engine": "walmart",
@@ -33,14 +78,94 @@ def search_walmart_products(query, filters, max_results=10):
                 "reviews": p.get("reviews"),
                 "url": p.get("product_page_url"),
                 "thumbnail": p.get("thumbnail"),
+                "product_id": p.get("us_item_id"),
             })
 
+        if parsed:
+            search_cache.set(key, [dict(p) for p in parsed])
         return parsed
 
     except Exception as e:
         print(f"🔴 SerpAPI fetch failed: {e}")
         return []
 
+def fetch_walmart_product_details(product_id):
+    """Fetch specs, seller and availability for one product. Returns None on failure."""
+    if not product_id:
+        return None
+    try:
+        search = GoogleSearch({
+            "engine": "walmart_product",
+            "product_id": str(product_id),
+            "api_key": SERPAPI_KEY,
+        })
+        result = search.get_dict().get("product_result", {})
+        if not result:
+            return None
+
+        specs = {
+            s.get("key"): s.get("value")
+            for s in result.get("specification_highlights", [])
+            if s.get("key")
+        }
+        return {
+            "specs": specs,
+            "seller": result.get("seller_name"),
+            "in_stock": result.get("in_stock"),
+            "manufacturer": result.get("manufacturer"),
+        }
+
+    except Exception as e:
+        print(f"🔴 SerpAPI product fetch failed: {e}")
+        return None
+
+
+def search_walmart_products_parallel(queries, filters, max_results=10, max_workers=MAX_PARALLEL_SEARCHES):
+    """Run one search per query concurrently. Returns a list of result lists, in query order."""
+    if not queries:
+        return []
+    if len(queries) == 1:
+        return [search_walmart_products(queries[0], filters, max_results)]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(queries))) as pool:
+        return list(pool.map(lambda q: search_walmart_products(q, filters, max_results), queries))
+
+
+def merge_product_results(result_lists, max_results=None):
+    """Interleave several result lists and drop duplicates by product URL."""
+    merged = []
+    seen = set()
+    longest = max((len(r) for r in result_lists), default=0)
+    for i in range(longest):
+        for results in result_lists:
+            if i >= len(results):
+                continue
+            p = results[i]
+            key = p.get("url") or p.get("title")
+            if key in seen:
+                continue
+            seen.add(key)
+            merged.append(p)
+    return merged[:max_results] if max_results else merged
+
+
+def build_search_queries(category, filters):
+    """One query per requested brand (deduplicated, case-insensitive), else just the category."""
+    brands = filters.get("brand")
+    if isinstance(brands, str):
+        brands = [brands]
+
+    queries = []
+    for b in brands or []:
+        if not b:
+            continue
+        # Skip the brand prefix if the category already names it
+        query = category if b.lower() in category.lower() else f"{b} {category}"
+        if query.lower() not in [q.lower() for q in queries]:
+            queries.append(query)
+    return queries or [category]
+
+
 def serpapi_sort(sort_by):
     if sort_by == "price":
         return "price_low"